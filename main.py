@@ -1,9 +1,23 @@
 import argparse
+import pathlib
+import sys
 
 # Import functions from the new modules
 from src.git_utils import analyze_real_git_commits
-from src.article_generator import generate_article_content
-from src.config_parser import load_config_from_ini
+from src.article_generator import iter_article_chunks
+from src.config_parser import load_config_from_ini, split_list
+
+
+def save_article(file_name, article):
+    """
+    Saves the article to a file. It is encoded once and written as bytes, which skips
+    the newline translation of text files and writes the whole article in one call.
+
+    Args:
+        file_name (str): The path of the file to write.
+        article (str): The article content.
+    """
+    pathlib.Path(file_name).write_bytes(article.encode("utf-8"))
 
 
 def main():
@@ -23,7 +37,8 @@ def main():
     parser.add_argument(
         "-c",
         "--company-identifier",
-        help='String to identify company commits (e.g., email domain or "My Company Name").',
+        help="Comma-separated strings to identify company commits "
+             '(e.g., email domains or "My Company Name").',
         type=str,
     )
     parser.add_argument(
@@ -35,7 +50,7 @@ def main():
     parser.add_argument(
         "-f",
         "--config-file",
-        help="Path to an INI configuration file. If provided and successfully loaded, "
+        help="Path to an INI (or .toml) configuration file. If provided and successfully loaded, "
              "it will override other core parameters (-r, -c, -m).",
         type=str,
     )
@@ -50,9 +65,12 @@ def main():
     parser.add_argument(
         "-d",
         "--deploy-dir",
-        help="Name of the directory to clone repositories into (default: 'deploy').",
+        "--workdir",
+        help="Directory to clone repositories into, relative to the current directory "
+             "or absolute, e.g. a tmpfs mount such as /dev/shm/git-analyzer to keep "
+             "clones in memory (default: 'deploy').",
         type=str,
-        default="deploy",
+        default=None,
     )
     parser.add_argument(
         "-k",
@@ -61,11 +79,33 @@ def main():
         type=str,
         default=None,
     )
+    parser.add_argument(
+        "-n",
+        "--numprocesses",
+        help="Number of worker processes analyzing cloned repositories "
+             "(default: one per repository, up to the number of CPUs).",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of repositories to clone in parallel "
+             "(default: one per repository, up to 8).",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--no-cache",
+        help="Analyze every repository again instead of reusing the results cached "
+             "from previous runs (also set by GIT_ANALYZER_DISABLE_CACHE=1).",
+        action="store_true",
+    )
 
     args = parser.parse_args()
 
     repo_urls = []
-    company_identifier = ""
+    company_identifiers = []
     months_back = None
     save_file_name = None
     deploy_dir = None
@@ -77,11 +117,11 @@ def main():
     if args.config_file:
         config_data = load_config_from_ini(args.config_file)
         if config_data:
-            repo_urls = config_data.get("repo_urls", [])
-            company_identifier = config_data.get("company_identifier", "")
-            months_back = config_data.get("months_back", None)
-            deploy_dir = config_data.get("deploy_dir", None)
-            openai_key = config_data.get("openai_apikey", None)
+            repo_urls = config_data.repo_urls
+            company_identifiers = config_data.company_identifiers
+            months_back = config_data.months_back
+            deploy_dir = config_data.deploy_dir
+            openai_key = config_data.openai_apikey
 
             config_loaded_successfully = True
             print(f"Configuration loaded from {args.config_file}.")
@@ -94,11 +134,9 @@ def main():
     # If config file was NOT successfully loaded, or not provided, then use CLI args
     if not config_loaded_successfully:
         if args.repo_urls:
-            repo_urls = [
-                url.strip() for url in args.repo_urls.split(",") if url.strip()
-            ]
+            repo_urls = split_list(args.repo_urls)
         if args.company_identifier:
-            company_identifier = args.company_identifier.strip()
+            company_identifiers = split_list(args.company_identifier)
         if args.months_back is not None:
             months_back = args.months_back
         if args.deploy_dir:
@@ -115,23 +153,39 @@ def main():
     if args.save_to_file is not None:
         save_file_name = args.save_to_file
 
+    # Without a terminal nobody can answer the prompts below, so fail right away
+    # instead of waiting on stdin
+    if not sys.stdin.isatty():
+        missing_options = [
+            option for option, is_missing in (
+                ("-r/--repo-urls", not repo_urls),
+                ("-c/--company-identifier", not company_identifiers),
+                ("-m/--months-back", months_back is None),
+            ) if is_missing
+        ]
+        if missing_options:
+            parser.error(f"{', '.join(missing_options)} required when not run from a "
+                         "terminal (or use -f/--config-file)")
+
     if not repo_urls:
         repo_urls_input = input(
             "Enter Git repository URLs (comma-separated, e.g.,"
             "https://github.com/org/repo1.git,https://github.com/org/repo2.git): "
         ).strip()
-        repo_urls = [url.strip() for url in repo_urls_input.split(",") if url.strip()]
+        repo_urls = split_list(repo_urls_input)
 
     if not repo_urls:
         print("No repository URLs provided. Exiting.")
         return
 
-    if not company_identifier:
-        company_identifier = input(
-            "Enter your company identifier (e.g., @mycompany.com or 'My Company Name'): "
+    if not company_identifiers:
+        company_identifiers_input = input(
+            "Enter your company identifiers (comma-separated, e.g., "
+            "@mycompany.com,'My Company Name'): "
         ).strip()
+        company_identifiers = split_list(company_identifiers_input)
 
-    if not company_identifier:
+    if not company_identifiers:
         print("Company identifier cannot be empty. Exiting.")
         return
 
@@ -149,7 +203,8 @@ def main():
 
     print("\nStarting real Git analysis...")
     analysis_result = analyze_real_git_commits(
-        repo_urls, company_identifier, months_back, deploy_dir
+        repo_urls, company_identifiers, months_back, deploy_dir, args.numprocesses, args.jobs,
+        use_cache=not args.no_cache
     )
 
     if "error" in analysis_result:
@@ -158,20 +213,41 @@ def main():
 
     commit_data = analysis_result.get("commit_data", [])
 
-    article = generate_article_content(commit_data, months_back, openai_key)
+    article_chunks = iter_article_chunks(commit_data, months_back, openai_key)
 
     print("\n--- Generated Article ---")
-    print(article)
-    print("\n--- End of Article ---")
-
     if save_file_name:
+        # Stream the article to the terminal and to the file together, one repository
+        # section at a time, so the whole article is never held in memory
+        save_error = None
         try:
-            with open(save_file_name, "w", encoding="utf-8") as f:
-                f.write(article)
+            with open(save_file_name, "wb", buffering=1 << 20) as f:
+                for chunk in article_chunks:
+                    sys.stdout.write(chunk)
+                    f.write(chunk.encode("utf-8"))
+        except OSError as e:
+            save_error = e
+        # If the file could not be written, print the rest of the article anyway
+        for chunk in article_chunks:
+            sys.stdout.write(chunk)
+        print("\n\n--- End of Article ---")
+
+        if save_error is None:
             print(f"Article automatically saved to {save_file_name}")
-        except Exception as e:
-            print(f"Error automatically saving file {save_file_name}: {e}")
+        else:
+            print(f"Error automatically saving file {save_file_name}: {save_error}")
     else:
+        # The article is kept to be saved if the user asks for it
+        article = []
+        for chunk in article_chunks:
+            sys.stdout.write(chunk)
+            article.append(chunk)
+        print("\n\n--- End of Article ---")
+
+        # Nobody can answer the question without a terminal; use -s to save instead
+        if not sys.stdin.isatty():
+            return
+
         save_option = (
             input("\nDo you want to save the article to a file? (yes/no): ")
             .lower()
@@ -182,8 +258,7 @@ def main():
             if not file_name:
                 file_name = "git_report.md"
             try:
-                with open(file_name, "w", encoding="utf-8") as f:
-                    f.write(article)
+                save_article(file_name, "".join(article))
                 print(f"Article saved to {file_name}")
             except Exception as e:
                 print(f"Error saving file: {e}")
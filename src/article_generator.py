@@ -1,29 +1,56 @@
 import datetime
 import os
 import textwrap
+from collections.abc import Iterator
 import markdown_strings as md
 from collections import defaultdict
 from datetime import datetime
 from src.git_utils import generate_commit_hyperlink
-from src.openai_utils import summarize_commit_messages
+from src.openai_utils import summarize_many_commit_messages
 
-def generate_article_content(commit_data: list[dict], months_back: int, openai_key: str) -> str:
+# Markdown characters escaped in commit subjects, so they render literally inside
+# the link text; str.translate applies all of them in a single pass
+_MD_ESCAPE = str.maketrans({"_": r"\_", "*": r"\*", "`": r"\`", "[": r"\[", "]": r"\]"})
+
+
+def _join_author_messages(author_commits: list[dict]) -> str:
     """
-    Generates a blog article based on commit data.
-    In a real tool, this would call a large language model API (e.g., Gemini).
+    Joins the commit messages of an author, one per line, for the summary prompt.
+
+    Args:
+        author_commits: The commits of the author.
+
+    Returns:
+        The commit messages of the author.
+    """
+    return "\n".join([
+        commit["message"] if commit["message"] else "(No message provided)"
+        for commit in author_commits
+    ])
+
+
+def iter_article_chunks(commit_data: list[dict], months_back: int,
+                        openai_key: str) -> Iterator[str]:
+    """
+    Generates a blog article based on commit data, one chunk at a time: the
+    introduction, one section per repository and the conclusion. Each chunk can be
+    written out and released before the next repository is processed.
 
     Args:
         commit_data: Structured commit data.
         months_back: The number of months the analysis covered.
+        openai_key: The OpenAI API key used to summarize the contributions of each
+                    author, or None to list the commits only.
 
-    Returns:
-        A string containing the blog article.
+    Yields:
+        The successive parts of the blog article.
     """
     if not commit_data:
-        return "No relevant commits found to generate an article."
+        yield "No relevant commits found to generate an article."
+        return
 
     today = datetime.now()
-    article_content = f"""
+    yield f"""
 # Today {today.strftime('%Y-%m-%d')} Developments: A Look at Our Codebase ({months_back} Months Review)
 
 We're excited to share a summary of the significant progress made across our repositories
@@ -34,51 +61,78 @@ Here's a breakdown of key contributions by repository:
 
 """
 
+    repo_authors = []
     for repo in commit_data:
 
         if "error" in repo or not repo["commits"]:
             continue
 
-        article_content += f"## {repo['repo_name']}\n\n"
-        article_content += f"Repository URL: {repo['repo_url']}\n\n"
-
         commits_by_author = defaultdict(list)
         for commit in repo["commits"]:
             commits_by_author[commit['author_name']].append(commit)
-
-        if not commits_by_author:
-            continue
-
-        for author_name, author_commits in sorted(commits_by_author.items()):
-            all_author_messages = "\n".join([
-                    commit["message"] if commit["message"] else "(No message provided)"
-                    for commit in author_commits
-                ])
-
+        repo_authors.append((repo, sorted(commits_by_author.items())))
+
+    summaries = {}
+    if openai_key:
+        # The summaries of all the authors are requested concurrently up front,
+        # rather than waiting for each one in turn while the article is written
+        summary_keys = [
+            (repo_index, author_name)
+            for repo_index, (_, authors) in enumerate(repo_authors)
+            for author_name, _ in authors
+        ]
+        summaries = dict(zip(summary_keys, summarize_many_commit_messages(openai_key, [
+            (_join_author_messages(author_commits), author_name)
+            for _, authors in repo_authors
+            for author_name, author_commits in authors
+        ], months_back)))
+
+    for repo_index, (repo, authors) in enumerate(repo_authors):
+        # A repository section is assembled from a list of parts joined once, since
+        # repeated string concatenation copies the whole section on every append
+        parts = [f"## {repo['repo_name']}\n\n", f"Repository URL: {repo['repo_url']}\n\n"]
+
+        for author_name, author_commits in authors:
             if openai_key:
-                ai_summary = summarize_commit_messages(openai_key, all_author_messages,
-                                                       months_back, author_name)
-                ai_summary = md.esc_format(ai_summary, esc=True)
-                article_content += "\n"
+                ai_summary = md.esc_format(summaries[(repo_index, author_name)], esc=True)
+                parts.append("\n")
                 if ai_summary:
-                    article_content += "### Summary of the contributions by author:\n\n"
                     wrapped_summary = textwrap.fill(ai_summary, width=100)
-                    article_content += f"**{author_name}**: {wrapped_summary}\n\n"
+                    parts.extend(("### Summary of the contributions by author:\n\n",
+                                  f"**{author_name}**: {wrapped_summary}\n\n"))
 
-            article_content += f"#### Here the commits of **{author_name}** in detail:\n\n"
+            parts.append(f"#### Here the commits of **{author_name}** in detail:\n\n")
             # Sort the commit by Author Name and then by date
             data = sorted(author_commits, key=lambda x: (x['author_name'], x['date']))
             for commit in data:
                 # Ensure the message is handled, even if it's empty or malformed
-                first_line_message = (commit["message"].split("\n")[0] if commit["message"] else "(No message)")
-                first_line_message = first_line_message.replace("_", r"\_")
-                hyperlink = generate_commit_hyperlink(repo['repo_path'], repo['repo_url'], commit['sha1'])
-                article_content += f"- **{commit['author_name']}** on {commit['date'].split('T')[0]}: [{first_line_message}]({hyperlink})\n"
-            article_content += "\n"
-    article_content += """
+                message = commit["message"] or "(No message)"
+                newline = message.find("\n")
+                first_line_message = message if newline < 0 else message[:newline]
+                first_line_message = first_line_message.translate(_MD_ESCAPE)
+                hyperlink = generate_commit_hyperlink(repo['repo_url'], commit['sha1'])
+                parts.append(f"- **{commit['author_name']}** on {commit['date'][:10]}: [{first_line_message}]({hyperlink})\n")
+            parts.append("\n")
+        yield "".join(parts)
+
+    yield """
 This overview highlights the continuous effort and innovation from our development team. We look forward to bringing even more exciting updates in the future!
 
 ---
 *Generated by the Git Commit Article Generator*
 """
-    return article_content
+
+
+def generate_article_content(commit_data: list[dict], months_back: int, openai_key: str) -> str:
+    """
+    Generates a blog article based on commit data.
+
+    Args:
+        commit_data: Structured commit data.
+        months_back: The number of months the analysis covered.
+        openai_key: The OpenAI API key, or None to list the commits only.
+
+    Returns:
+        A string containing the blog article.
+    """
+    return "".join(iter_article_chunks(commit_data, months_back, openai_key))
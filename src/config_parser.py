@@ -1,33 +1,167 @@
 import configparser
+import functools
+from dataclasses import dataclass
 
+try:
+    import tomllib
+    TOML_SUPPORTED = True
+except ModuleNotFoundError:  # Python < 3.11
+    TOML_SUPPORTED = False
 
-def load_config_from_ini(file_path: str) -> dict | None:
+
+@dataclass(frozen=True, slots=True)
+class GitConfig:
+    """
+    Configuration loaded from an INI or TOML file. Settings missing from the file
+    keep their default value.
+    """
+    repo_urls: tuple[str, ...] = ()
+    company_identifiers: tuple[str, ...] = ()
+    months_back: int | None = None
+    deploy_dir: str | None = None
+    openai_apikey: str | None = None
+
+
+def split_list(value) -> tuple[str, ...]:
+    """
+    Splits a comma-separated value, dropping surrounding spaces, empty items and
+    duplicates, so a repository listed twice is not cloned twice.
+
+    Args:
+        value: The raw value, either a comma-separated string or a list of strings.
+
+    Returns:
+        A tuple with the items of the list, in their original order.
+
+    Raises:
+        ValueError: If the value is neither a string nor a list of strings.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    elif not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(
+            f"expected a comma-separated string or a list of strings, got {value!r}"
+        )
+    # dict.fromkeys drops the duplicates while keeping the first occurrences in order
+    return tuple(dict.fromkeys(filter(None, map(str.strip, value))))
+
+
+def _get_int(section, key: str) -> int | None:
     """
-    Loads configuration from an INI file.
+    Reads an integer setting, treating an empty INI value like a missing one.
+
+    Args:
+        section: The configuration section, from an INI or a TOML file.
+        key: The name of the setting.
+
+    Returns:
+        The value of the setting, or None if it is missing or empty.
+
+    Raises:
+        ValueError: If the value is not an integer.
+    """
+    value = section.get(key, None)
+    if value is None or value == "":
+        return None
+    # bool is a subclass of int, and int() would truncate a TOML float
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{key} must be an integer, got {value!r}")
+    return int(value)
+
+
+def _get_str(section, key: str) -> str | None:
+    """
+    Reads a string setting.
+
+    Args:
+        section: The configuration section, from an INI or a TOML file.
+        key: The name of the setting.
+
+    Returns:
+        The value of the setting, or None if it is missing.
+
+    Raises:
+        ValueError: If the value is not a string.
+    """
+    value = section.get(key, None)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{key} must be a string, got {value!r}")
+    return value
+
+
+def _load_toml(file_path: str) -> dict:
+    """
+    Reads a TOML configuration file, which uses the same sections and keys as the
+    INI file.
+
+    Args:
+        file_path: The path to the TOML configuration file.
+
+    Returns:
+        A dictionary with the sections of the file.
+    """
+    if not TOML_SUPPORTED:
+        raise ValueError("TOML configuration files require Python 3.11 or later")
+    with open(file_path, "rb") as f:
+        config = tomllib.load(f)
+    for section in ("GitConfig", "OpenAi"):
+        if section in config and not isinstance(config[section], dict):
+            raise ValueError(f"{section} must be a table")
+    return config
+
+
+def _load_ini(file_path: str) -> configparser.ConfigParser:
+    """
+    Reads an INI configuration file.
 
     Args:
         file_path: The path to the INI configuration file.
 
     Returns:
-        A dictionary containing the configuration, or None if the file cannot be read.
+        The parsed configuration.
     """
     config = configparser.ConfigParser()
+    with open(file_path, "r", encoding="utf-8") as f:
+        config.read_file(f)
+    return config
+
+
+@functools.lru_cache(maxsize=8)
+def load_config_from_ini(file_path: str) -> GitConfig | None:
+    """
+    Loads configuration from an INI file, or from a TOML file if the path ends
+    with '.toml'. The result is cached per path, so repeated loads in the same
+    process do not parse the file again.
+
+    Args:
+        file_path: The path to the configuration file.
+
+    Returns:
+        The configuration, or None if the file cannot be read or has none of the
+        known sections.
+    """
     try:
-        config.read(file_path)
+        if file_path.endswith(".toml"):
+            config = _load_toml(file_path)
+        else:
+            config = _load_ini(file_path)
+
+        if "GitConfig" not in config and "OpenAi" not in config:
+            print(f"No GitConfig or OpenAi section found in {file_path}")
+            return None
+
         git_config = {}
         if "GitConfig" in config:
-            repo_urls_str = config["GitConfig"].get("repo_urls", "")
-            git_config["repo_urls"] = [
-                url.strip() for url in repo_urls_str.split(",") if url.strip()
-            ]
-            git_config["company_identifier"] = (
-                config["GitConfig"].get("company_identifier", "").strip()
+            section = config["GitConfig"]
+            git_config["repo_urls"] = split_list(section.get("repo_urls", ""))
+            git_config["company_identifiers"] = split_list(
+                section.get("company_identifier", "")
             )
-            git_config["months_back"] = config["GitConfig"].getint("months_back", None)
-            git_config["deploy_dir"] = config["GitConfig"].get("deploy_dir", None)
+            git_config["months_back"] = _get_int(section, "months_back")
+            git_config["deploy_dir"] = _get_str(section, "deploy_dir")
         if "OpenAi" in config:
-            git_config["openai_apikey"] = config["OpenAi"].get("openai_apikey", None)
-        return git_config
-    except Exception as e:
-        print(f"Error reading INI file {file_path}: {e}")
+            git_config["openai_apikey"] = _get_str(config["OpenAi"], "openai_apikey")
+        return GitConfig(**git_config)
+    except (OSError, configparser.Error, ValueError) as e:
+        print(f"Error reading configuration file {file_path}: {e}")
         return None
@@ -8,57 +8,276 @@ existing ones.
 
 """
 
+import hashlib
+import json
+import multiprocessing
 import os
 import shutil
+import threading
+import uuid
 import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from git import Repo, InvalidGitRepositoryError, NoSuchPathError, GitCommandError
 
 
-def generate_commit_hyperlink(repo_path, base_web_url, commit_hash_prefix):
+def _log(*args):
+    """
+    Prints a message, holding a lock so that messages printed by concurrent clone
+    threads are not mixed on the same line.
+
+    Args:
+        *args: The values to print, as for print().
+    """
+    with _log_lock:
+        print(*args, flush=True)
+
+
+def generate_commit_hyperlink(base_web_url, commit_hash):
     """
     Generates an hyperlink to a Git commit on a web platform.
 
     Args:
-        repo_path (str): The path to the local Git repository.
         base_web_url (str): The base URL for the repository on the web
                             (e.g., "https://github.com/your_username/your_repo").
-        commit_hash_prefix (str): A full or partial commit hash.
+        commit_hash (str): The full commit hash.
+
+    Returns:
+        str: The hyperlink string.
+    """
+    special_cases_prefixes = [
+        "https://git.kernel.org",
+        "https://git.openembedded.org"
+    ]
+
+    for prefix in special_cases_prefixes:
+        if base_web_url.startswith(prefix):
+            return f"{base_web_url}/commit/?id={commit_hash}"
+
+    if base_web_url.endswith(".git"):
+        base_web_url = base_web_url[:-4]
+    return f"{base_web_url}/commit/{commit_hash}"
+
+
+# Environment of every git process that may talk to the remotes: clones and fetches,
+# but also reads of a blobless clone, which fetch missing objects on demand. Prompts
+# are disabled so a repository asking for credentials fails instead of blocking its
+# thread or worker process, and the protocol settings, passed as GIT_CONFIG_*
+# variables (git 2.31+), cut down the round-trips of the ref negotiation
+GIT_REMOTE_ENV = {
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_CONFIG_COUNT": "2",
+    "GIT_CONFIG_KEY_0": "protocol.version",
+    "GIT_CONFIG_VALUE_0": "2",
+    "GIT_CONFIG_KEY_1": "fetch.negotiationAlgorithm",
+    "GIT_CONFIG_VALUE_1": "skipping",
+}
+
+# Only commit metadata is ever read, so clones are bare and skip blobs, tags and
+# other branches
+SHALLOW_CLONE_OPTIONS = ["--filter=blob:none", "--no-tags", "--single-branch"]
+
+
+# Fields of a commit in the 'git log' output, separated by the ASCII unit separator.
+# %aN/%aE report the identity mapped by the repository .mailmap.
+GIT_LOG_FORMAT = "%H%x1f%aN%x1f%aE%x1f%ad%x1f%B"
+
+# Options of the 'git log' walk that do not depend on the analysis parameters.
+# --no-use-mailmap makes --author match the identity recorded in the commit rather
+# than the mapped one (log.mailmap is on by default), so a .mailmap entry can
+# neither add nor remove company commits. The date is rendered in local time, as
+# datetime.fromtimestamp() would do.
+GIT_LOG_OPTIONS = (
+    "--no-merges",
+    "--no-use-mailmap",
+    "--fixed-strings",
+    "--regexp-ignore-case",
+    "-z",
+    f"--format={GIT_LOG_FORMAT}",
+    "--date=format-local:%Y-%m-%dT%H:%M:%S",
+)
+
+
+# Clones are network bound, so they run in threads rather than worker processes
+CLONE_WORKERS = 8
+
+# Serializes the output of the clone threads, so their lines do not interleave
+_log_lock = threading.Lock()
+
+# Analysis workers are started while clone threads run: forking then could copy
+# locks held by those threads into the child, so the workers are spawned instead
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+# Analysis results are cached per repository HEAD under the deploy directory
+ANALYSIS_CACHE_DIR = ".analysis-cache"
+ANALYSIS_CACHE_MAX_ENTRIES = 500
+
+# Results already computed in this process, keyed like the analysis cache, so that
+# repeated calls (e.g. when used as a library) skip the worker processes entirely
+_analysis_memo = OrderedDict()
+ANALYSIS_MEMO_MAX_ENTRIES = 128
+
+
+def _iter_log_records(stream, chunk_size=65536):
+    """
+    Yields the records of a 'git log -z' output as they are read from the pipe.
+
+    Args:
+        stream: The binary stdout of the 'git log' process.
+        chunk_size (int): The number of bytes read at once.
 
     Returns:
-        str: The hyperlink string, or None if the commit is not found.
+        generator: The NUL separated records, as bytes.
+    """
+    pending = b""
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        records = (pending + chunk).split(b"\0")
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+def _git_date(date):
+    """
+    Formats a date for git options as a Unix timestamp ('@<seconds>'), which git
+    reads without going through its approximate date parser and which does not
+    depend on the time zone of the git process.
+
+    Args:
+        date (datetime): The date to format.
+
+    Returns:
+        str: The date in git's raw timestamp format.
+    """
+    return f"@{int(date.timestamp())}"
+
+
+def _shallow_fallback_options(error):
+    """
+    Picks the options to retry a shallow clone or fetch refused by git.
+
+    Args:
+        error (GitCommandError): The error raised by the clone or fetch command.
+
+    Returns:
+        list[str]: The options replacing --shallow-since, or None if the error is not
+                   about the shallow request.
+    """
+    stderr = str(error.stderr)
+    if "no commits selected for shallow requests" in stderr:
+        # Nothing happened in the timeframe, the tip alone is enough
+        return ["--depth=1"]
+    if "does not support" in stderr:
+        # The server (or a dumb transport) cannot cut the history: get all of it,
+        # still without blobs
+        return []
+    return None
+
+
+def _clone_since(url, path, since_date):
+    """
+    Clones only the history of a repository newer than since_date, without blobs and
+    without a working tree.
+
+    Args:
+        url (str): The URL of the remote Git repository.
+        path (str): The path to clone into.
+        since_date (datetime): The oldest commit date of interest.
+
+    Returns:
+        Repo: The cloned repository.
     """
     try:
-        repo = Repo(repo_path)
-        commit = repo.commit(commit_hash_prefix)
-
-        commit_full_hash = commit.hexsha
-        commit_message = commit.summary
-        special_cases_prefixes = [
-            "https://git.kernel.org",
-            "https://git.openembedded.org"
-        ]
-
-        commit_url = None
-        for prefix in special_cases_prefixes:
-            if base_web_url.startswith(prefix):
-                commit_url = f"{base_web_url}/commit/?id={commit_full_hash}"
-                break
-
-        if commit_url is None:
-            if base_web_url.endswith(".git"):
-                base_web_url = base_web_url[:-4]
-            commit_url = f"{base_web_url}/commit/{commit_full_hash}"
-
-        hyperlink = f'{commit_url}'
-        return hyperlink
+        return Repo.clone_from(url, path, env=GIT_REMOTE_ENV, bare=True,
+                               multi_options=SHALLOW_CLONE_OPTIONS + [
+                                   f"--shallow-since={_git_date(since_date)}"
+                               ])
+    except GitCommandError as e:
+        fallback_options = _shallow_fallback_options(e)
+        if fallback_options is None:
+            raise
+        _log(f"Shallow clone of '{url}' refused, retrying with "
+             f"{' '.join(fallback_options) or 'the full history'}.")
+        return Repo.clone_from(url, path, env=GIT_REMOTE_ENV, bare=True,
+                               multi_options=SHALLOW_CLONE_OPTIONS + fallback_options)
+
+
+def _fetch_since(repo, since_date):
+    """
+    Fetches the history of origin newer than since_date straight into the branch of
+    a bare clone. The blob filter of the clone is remembered by git, so it is not
+    repeated here. Fetching into the checked out branch of a non bare repository
+    is refused by git, so clones made by older versions fail here and get re-cloned.
 
-    except Exception as e:
-        print(f"Error generating hyperlink: {e}")
-        return None
+    Args:
+        repo (Repo): The bare repository to update.
+        since_date (datetime): The oldest commit date of interest.
+    """
+    refspec = f"+HEAD:{repo.head.ref.path}"
+    try:
+        repo.git.fetch(f"--shallow-since={_git_date(since_date)}", "origin", refspec)
+    except GitCommandError as e:
+        fallback_options = _shallow_fallback_options(e)
+        if fallback_options is None:
+            raise
+        repo.git.fetch(*fallback_options, "origin", refspec)
+
+
+def _open_repo(repo_path):
+    """
+    Opens a local repository whose git processes run with GIT_REMOTE_ENV, since any
+    of them may contact the remote of a blobless clone.
+
+    Args:
+        repo_path (str): The path to the local Git repository.
+
+    Returns:
+        Repo: The repository.
+    """
+    repo = Repo(repo_path)
+    repo.git.update_environment(**GIT_REMOTE_ENV)
+    return repo
+
+
+def _fetch_mailmap(repo):
+    """
+    Downloads the .mailmap blob of HEAD, if the repository has one. Clones are
+    blobless, so 'git log' would otherwise fetch it from the remote while the
+    analysis reads the author names; fetching it here keeps the network transfers
+    in the clone stage.
+
+    Args:
+        repo (Repo): The cloned repository.
+    """
+    try:
+        repo.git.cat_file("-e", "HEAD:.mailmap")
+    except GitCommandError:
+        # The repository has no .mailmap
+        pass
 
 
-def git_pull_or_clone(remote_url=None, repo_path="."):
+def _discard_directory(path):
+    """
+    Removes a directory without waiting for the deletion of every file: it is renamed
+    into a '.trash' sibling directory, a single syscall, and deleted by a background
+    thread. The thread is not a daemon, so the deletion completes before exiting.
+
+    Args:
+        path (str): The directory to remove.
+
+    Raises:
+        OSError: If the directory cannot be moved to the trash.
+    """
+    trash_path = os.path.join(os.path.dirname(path), ".trash", uuid.uuid4().hex)
+    os.makedirs(os.path.dirname(trash_path), exist_ok=True)
+    os.rename(path, trash_path)
+    threading.Thread(target=shutil.rmtree, args=(trash_path,),
+                     kwargs={"ignore_errors": True}).start()
+
+
+def git_pull_or_clone(remote_url=None, repo_path=".", since_date=None):
     """
     Checks if a directory is a Git repository.
     If it is, performs a 'git pull'.
@@ -72,6 +291,8 @@ def git_pull_or_clone(remote_url=None, repo_path="."):
                                     or if a pull fails and a re-clone is desired.
         repo_path (str): The path to the directory to check or clone into.
                          Defaults to the current directory.
+        since_date (datetime, optional): When given, only the history newer than this
+                                         date is cloned or fetched (shallow clone).
     Returns:
         repo: Return the repository if the clone is successfull otherwise None.
     """
@@ -80,203 +301,479 @@ def git_pull_or_clone(remote_url=None, repo_path="."):
 
     # Helper function to perform cloning
     def _perform_clone(url, path):
-        print(f"Attempting to clone repository from '{url}' into '{path}'...")
+        _log(f"Attempting to clone repository from '{url}' into '{path}'...")
         try:
             # Ensure the parent directory exists before cloning
             parent_dir = os.path.dirname(path)
             if parent_dir and not os.path.exists(parent_dir):
                 os.makedirs(parent_dir)
 
-            repo = Repo.clone_from(url, path)
-            print(f"Repository successfully cloned into '{path}'.")
+            if since_date is None:
+                repo = Repo.clone_from(url, path, env=GIT_REMOTE_ENV)
+            else:
+                repo = _clone_since(url, path, since_date)
+            _log(f"Repository successfully cloned into '{path}'.")
             return repo
         except GitCommandError as e:
-            print(f"Error during 'git clone': {e}")
-            print(f"Stdout: {e.stdout}")
-            print(f"Stderr: {e.stderr}")
+            _log(f"Error during 'git clone': {e}")
+            _log(f"Stdout: {e.stdout}")
+            _log(f"Stderr: {e.stderr}")
             return None
         except Exception as e:
-            print(f"An unexpected error occurred during cloning: {e}")
+            _log(f"An unexpected error occurred during cloning: {e}")
             return None
 
     try:
         # Attempt to open the directory as an existing Git repository
-        repo = Repo(abs_repo_path)
+        repo = _open_repo(abs_repo_path)
 
-        print(f"'{abs_repo_path}' appears to be an existing Git repository.")
-        print("Attempting to perform 'git pull' using GitPython...")
+        _log(f"'{abs_repo_path}' appears to be an existing Git repository.")
+        _log("Attempting to perform 'git pull' using GitPython...")
 
         try:
             # Perform git pull from the 'origin' remote
-            repo.remotes.origin.pull()
+            if since_date is None:
+                repo.remotes.origin.pull()
+            else:
+                _fetch_since(repo, since_date)
 
-            print("Git pull successful:")
-            return Repo(abs_repo_path)
+            _log("Git pull successful:")
+            return _open_repo(abs_repo_path)
         except GitCommandError as e:
-            print(f"Error during 'git pull': {e}")
-            print(f"Stdout: {e.stdout}")
-            print(f"Stderr: {e.stderr}")
+            _log(f"Error during 'git pull': {e}")
+            _log(f"Stdout: {e.stdout}")
+            _log(f"Stderr: {e.stderr}")
+
+            # A shallow update already forces the branch onto origin. A pulled working
+            # tree has most likely diverged from origin: realign it on the fetched
+            # objects rather than downloading the whole repository again.
+            if since_date is None:
+                try:
+                    _log("Attempting to reset the local branch onto 'origin'...")
+                    repo.git.fetch("--force", "--prune", "origin")
+                    repo.git.reset("--hard", f"origin/{repo.active_branch.name}")
+                    _log("Local branch reset onto 'origin'.")
+                    return repo
+                except (GitCommandError, TypeError) as reset_e:
+                    _log(f"Error resetting onto 'origin': {reset_e}")
 
             if remote_url:
-                print(f"Git pull failed. Attempting to remove '{abs_repo_path}' and re-clone...")
+                _log(f"Git pull failed. Attempting to remove '{abs_repo_path}' and re-clone...")
                 # Remove the existing directory
                 if os.path.exists(abs_repo_path):
                     try:
-                        shutil.rmtree(abs_repo_path)
-                        print(f"Removed existing directory '{abs_repo_path}'.")
+                        _discard_directory(abs_repo_path)
+                        _log(f"Removed existing directory '{abs_repo_path}'.")
                     except OSError as remove_e:
-                        print(f"Error removing directory '{abs_repo_path}': {remove_e}")
+                        _log(f"Error removing directory '{abs_repo_path}': {remove_e}")
                         return None # Cannot proceed with re-clone if removal fails
 
                 # Now attempt to re-clone
                 return _perform_clone(remote_url, abs_repo_path)
 
-            print("Git pull failed and no remote URL provided for re-cloning.")
+            _log("Git pull failed and no remote URL provided for re-cloning.")
             return None # Operation was attempted, but failed without re-clone option
 
     except (InvalidGitRepositoryError, NoSuchPathError):
         # If it's not a valid Git repository or the path doesn't exist, try to clone
-        print(f"'{abs_repo_path}' is not a valid Git repository or does not exist.")
+        _log(f"'{abs_repo_path}' is not a valid Git repository or does not exist.")
         if remote_url:
             return _perform_clone(remote_url, abs_repo_path)
 
-        print("No remote URL provided to clone the repository.")
+        _log("No remote URL provided to clone the repository.")
         return None # No operation attempted
 
     except Exception as e: # Catch any other unexpected errors at the top level
-        print(f"An unexpected error occurred: {e}")
+        _log(f"An unexpected error occurred: {e}")
         return None # An operation was attempted, even if it failed
 
 
+def _collect_company_commits(repo, company_identifiers, since_date):
+    """
+    Collects the non merge commits made by the company since the given date.
+
+    Args:
+        repo (Repo): The repository to analyze.
+        company_identifiers (list[str]): The strings identifying company commits.
+        since_date (datetime): The oldest commit date of interest.
+
+    Returns:
+        list[dict]: The structured data of the company commits.
+    """
+    company_commits = []
+
+    # A single 'git log' process streams the fields of every non merge commit
+    # since `since_date`, so no Commit object is built per commit.
+    # git also filters the authors itself: each identifier is an --author pattern,
+    # matched as a case-insensitive fixed string against the recorded
+    # "Name <email>", and the patterns are ORed.
+    proc = repo.git.log(
+        f"--since={_git_date(since_date)}",
+        *GIT_LOG_OPTIONS,
+        *(f"--author={identifier}" for identifier in company_identifiers),
+        as_process=True,
+    )
+
+    for record in _iter_log_records(proc.stdout):
+        sha1_hash, author_name, author_email, commit_date, commit_message = (
+            record.decode("utf-8", "replace").split("\x1f", 4)
+        )
+        company_commits.append(
+            {
+                "hash": sha1_hash,
+                "author_name": author_name,
+                "author_email": author_email,
+                "date": commit_date,
+                "message": commit_message.strip(),
+                "sha1": sha1_hash,
+            }
+        )
+    # Raises GitCommandError if 'git log' failed
+    proc.wait()
+
+    return company_commits
+
+
+def _analysis_cache_path(deploy_target_dir, repo_url, head_sha, since_ts, company_identifiers):
+    """
+    Builds the path of the cached analysis of a repository. The key covers everything
+    the result depends on, log options included, so a new commit on the branch makes
+    a new entry.
+
+    Args:
+        deploy_target_dir (str): The directory where repositories are cloned.
+        repo_url (str): The Git repository URL.
+        head_sha (str): The commit the branch points to.
+        since_ts (int): Unix timestamp from which commits are taken into account.
+        company_identifiers (list[str]): The strings identifying company commits.
+
+    Returns:
+        str: The path of the JSON cache entry.
+    """
+    key_material = json.dumps([repo_url, head_sha, since_ts, company_identifiers,
+                               GIT_LOG_OPTIONS])
+    key = hashlib.sha1(key_material.encode()).hexdigest()
+    return os.path.join(deploy_target_dir, ANALYSIS_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_commits(cache_path):
+    """
+    Loads a cached analysis and marks it as recently used.
+
+    Args:
+        cache_path (str): The path of the JSON cache entry.
+
+    Returns:
+        list[dict]: The cached company commits, or None on a cache miss.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            commits = json.load(f)
+        os.utime(cache_path)
+        return commits
+    except (OSError, ValueError):
+        return None
+
+
+def _entry_mtime(entry):
+    """
+    Returns the modification time of a cache entry.
+
+    Args:
+        entry (os.DirEntry): The cache entry.
+
+    Returns:
+        float: The modification time, or 0 if a concurrent eviction already
+               removed the entry, so it sorts first and is skipped.
+    """
+    try:
+        return entry.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+def evict_cache_entries(cache_dir, max_entries):
+    """
+    Removes the least recently used JSON entries of a cache directory beyond
+    max_entries. Concurrent writers may evict the same entries at the same time,
+    so entries that are already gone are skipped.
+
+    Args:
+        cache_dir (str): The cache directory.
+        max_entries (int): The number of entries to keep.
+
+    Raises:
+        OSError: If the directory cannot be listed or an entry cannot be removed.
+    """
+    entries = sorted(
+        (entry for entry in os.scandir(cache_dir) if entry.name.endswith(".json")),
+        key=_entry_mtime,
+    )
+    for entry in entries[:-max_entries]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def _store_cached_commits(cache_path, commits):
+    """
+    Stores an analysis in the cache and evicts the least recently used entries
+    beyond ANALYSIS_CACHE_MAX_ENTRIES. Failures only cost a future cache miss.
+
+    Args:
+        cache_path (str): The path of the JSON cache entry.
+        commits (list[dict]): The company commits to cache.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(commits, f)
+        os.replace(tmp_path, cache_path)
+
+        evict_cache_entries(cache_dir, ANALYSIS_CACHE_MAX_ENTRIES)
+    except OSError as e:
+        _log(f"Error caching analysis in '{cache_path}': {e}")
+
+
+def _clone_one_repo(repo_url: str, since_date: datetime, deploy_target_dir: str) -> dict:
+    """
+    Clones or updates a single repository. Runs in a clone thread: the work happens
+    in the git subprocess, so threads overlap the network transfers.
+
+    Args:
+        repo_url: The Git repository URL.
+        since_date: The oldest commit date of interest.
+        deploy_target_dir: The directory where the repository is cloned.
+
+    Returns:
+        A dictionary describing the repository, with an "error" key and no commits
+        when it could not be cloned.
+    """
+    repo_name = os.path.basename(repo_url.rstrip("/")).removesuffix(".git")
+    # Forks share the repository name and are cloned at the same time, so the
+    # directory is made unique with a hash of the URL
+    url_hash = hashlib.sha1(repo_url.encode()).hexdigest()[:8]
+    repo_path = os.path.join(deploy_target_dir, f"{repo_name}-{url_hash}")
+    repo_data = {
+        "repo_name": repo_name,
+        "repo_url": repo_url,
+        "repo_path": repo_path,
+    }
+
+    _log(f"Cloning {repo_url} directly into {repo_path}...")
+    try:
+        repo = git_pull_or_clone(repo_url, repo_path, since_date)
+        if repo is None:
+            return {**repo_data, "error": "Failed to clone or update the repository",
+                    "commits": []}
+        _fetch_mailmap(repo)
+        _log(f"Successfully cloned {repo_name}.")
+        return {**repo_data, "head_sha": repo.head.commit.hexsha}
+
+    except GitCommandError as e:
+        error_msg = str(e)
+        _log(f"Error cloning repository {repo_url}: {error_msg}")
+        return {
+            **repo_data,
+            "error": f"Failed to clone: {error_msg}",
+            "commits": [],  # No commits if clone failed
+        }
+    except Exception as e:
+        _log(
+            f"An unexpected error occurred during cloning {repo_url}: {str(e)}"
+        )
+        return {
+            **repo_data,
+            "error": f"An unexpected error occurred during cloning: {str(e)}",
+            "commits": [],
+        }
+
+
+def _analyze_one_repo(repo_data: dict, company_identifiers: list[str], since_ts: int,
+                      cache_path: str | None) -> dict:
+    """
+    Collects the commits made by the company since the given date in a cloned
+    repository. Runs in a worker process, so every argument must be picklable.
+    The cache has already been looked up by the caller: this only runs on a miss.
+
+    Args:
+        repo_data: The repository description returned by _clone_one_repo.
+        company_identifiers: The strings identifying company commits.
+        since_ts: Unix timestamp from which commits are taken into account.
+        cache_path: The analysis cache entry to store the result into, or None
+                    when the cache is disabled.
+
+    Returns:
+        A dictionary with the structured commit data of the repository, with an
+        "error" key when the repository could not be analyzed.
+    """
+    since_date = datetime.fromtimestamp(since_ts)
+    repo_name = repo_data["repo_name"]
+
+    _log(f"Analyzing commits for {repo_name} since "
+         f"{since_date.strftime('%Y-%m-%d %H:%M:%S')}...")
+    try:
+        repo = _open_repo(repo_data["repo_path"])
+        repo_commits_list = _collect_company_commits(repo, company_identifiers, since_date)
+        if cache_path is not None:
+            _store_cached_commits(cache_path, repo_commits_list)
+
+        return {**repo_data, "commits": repo_commits_list}
+
+    except GitCommandError as e:
+        error_msg = str(e)
+        _log(f"Error getting git log for {repo_name}: {error_msg}")
+        return {
+            **repo_data,
+            "error": f"Failed to get commit log: {error_msg}",
+            "commits": [],
+        }
+    except Exception as e:
+        _log(f"Error processing commits for {repo_name}: {e}")
+        return {
+            **repo_data,
+            "error": f"Error processing commits: {str(e)}",
+            "commits": [],
+        }
+
+
+def _remember_analysis(memo_key, commits):
+    """
+    Keeps the commits of an analyzed repository in the in-process memo, evicting the
+    least recently used entries beyond ANALYSIS_MEMO_MAX_ENTRIES.
+
+    Args:
+        memo_key (tuple): The key of the analysis.
+        commits (list[dict]): The company commits of the repository.
+    """
+    # The memo keeps its own copy, so mutating a result cannot alter it
+    _analysis_memo[memo_key] = tuple(dict(commit) for commit in commits)
+    while len(_analysis_memo) > ANALYSIS_MEMO_MAX_ENTRIES:
+        _analysis_memo.popitem(last=False)
+
+
 def analyze_real_git_commits(
-    repo_urls: list[str], company_identifier: str, months_back: int, deploy_dir_name: str
+    repo_urls: list[str], company_identifiers: list[str] | str, months_back: int,
+    deploy_dir_name: str, num_processes: int | None = None, num_jobs: int | None = None,
+    use_cache: bool = True
 ) -> dict:
     """
     Clones Git repositories, finds commits by a specified company within a timeframe,
-    and returns structured commit data.
+    and returns structured commit data. Cloning and analysis are pipelined: clones
+    run in a thread pool and each repository is handed to a pool of worker processes
+    as soon as its clone completes, while the others are still downloading. Cached
+    analyses are read directly, without going through the worker processes.
 
     Args:
-        repo_urls: A list of Git repository URLs.
-        company_identifier: A string to identify company commits (e.g., email domain or part
-                            of the committer name).
+        repo_urls: A list of Git repository URLs. A URL listed more than once is
+                   analyzed once.
+        company_identifiers: The strings identifying company commits (e.g., email domains
+                             or parts of the committer name). A commit matches if any
+                             of them is found in its author name or email. A single
+                             string is taken as one identifier.
         months_back: An integer representing the number of months to look back for commits.
-        deploy_dir_name: The name of the directory where repositories will be cloned.
+        deploy_dir_name: The directory where repositories will be cloned, relative to the
+                         current directory or absolute (e.g. on a tmpfs mount).
+        num_processes: The number of analysis worker processes. Defaults to the number of
+                       repositories, capped to the number of CPUs.
+        num_jobs: The number of repositories cloned in parallel. Defaults to the number
+                  of repositories, capped to CLONE_WORKERS.
+        use_cache: Whether per-repository results are cached under the deploy directory
+                   and in memory for later calls in the same process. Setting
+                   GIT_ANALYZER_DISABLE_CACHE=1 in the environment disables it too.
 
     Returns:
         A dictionary containing the structured commit data or an error message.
     """
-    all_repo_commits_structured = []
-
     project_root = os.getcwd()
-    deploy_target_dir = os.path.join(project_root, deploy_dir_name)
+    deploy_target_dir = os.path.join(project_root, os.path.expanduser(deploy_dir_name))
+    # The same URL twice would be cloned twice into the same directory at once
+    repo_urls = list(dict.fromkeys(repo_urls))
+    # Callers written for the single identifier API pass a string, which would
+    # otherwise be iterated one character at a time
+    if isinstance(company_identifiers, str):
+        company_identifiers = [company_identifiers]
 
     try:
         # Ensure the deploy directory exists
         os.makedirs(deploy_target_dir, exist_ok=True)
 
-        # Calculate the 'since' date for commit filtering
-        since_date = datetime.now() - timedelta(days=months_back * 30)
-
-        for repo_url in repo_urls:
-            repo_name = repo_url.split("/")[-1].replace(".git", "")
-            repo_path = os.path.join(deploy_target_dir, repo_name)
-
-            print(f"Cloning {repo_url} directly into {repo_path}...")
-            try:
-                repo = git_pull_or_clone(repo_url, repo_path)
-                print(f"Successfully cloned {repo_name}.")
-
-            except GitCommandError as e:
-                error_msg = str(e)
-                print(f"Error cloning repository {repo_url}: {error_msg}")
-                all_repo_commits_structured.append(
-                    {
-                        "repo_name": repo_name,
-                        "repo_url": repo_url,
-                        "repo_path": repo_path,
-                        "error": f"Failed to clone: {error_msg}",
-                        "commits": [],  # No commits if clone failed
-                    }
-                )
-                continue  # Skip to next repository
-            except Exception as e:
-                print(
-                    f"An unexpected error occurred during cloning {repo_url}: {str(e)}"
-                )
-                all_repo_commits_structured.append(
-                    {
-                        "repo_name": repo_name,
-                        "repo_url": repo_url,
-                        "repo_path": repo_path,
-                        "error": f"An unexpected error occurred during cloning: {str(e)}",
-                        "commits": [],
-                    }
-                )
-                continue
-
-            print(f"Analyzing commits for {repo_name} since "
-                  f"{since_date.strftime('%Y-%m-%d %H:%M:%S')}...")
-            repo_commits_list = []
-            try:
-                # Iterate through commits
-                # We filter by `after` date to get commits since `since_date`
-                # and exclude merge commits by checking if the commit has more than one parent.
-                # GitPython's log method can also take `after` and `no_merges` arguments directly.
-                for commit in repo.iter_commits(since=since_date, no_merges=True):
-                    author_name = commit.author.name
-                    author_email = commit.author.email
-                    commit_date = datetime.fromtimestamp(commit.authored_date).isoformat()
-                    commit_message = commit.message.strip()
-                    sha1_hash = commit.hexsha
-
-                    # Filter by company identifier (case-insensitive)
-                    if (
-                        company_identifier.lower() in author_name.lower()
-                        or company_identifier.lower() in author_email.lower()
-                    ):
-                        repo_commits_list.append(
-                            {
-                                "hash": commit.hexsha,
-                                "author_name": author_name,
-                                "author_email": author_email,
-                                "date": commit_date,
-                                "message": commit_message,
-                                "sha1": sha1_hash,
-                            }
-                        )
-
-                all_repo_commits_structured.append(
-                    {
-                        "repo_name": repo_name,
-                        "repo_url": repo_url,
-                        "repo_path": repo_path,
-                        "commits": repo_commits_list,
-                    }
+        # Calculate the 'since' date for commit filtering. It starts at midnight so
+        # runs of the same day share the same cached analysis.
+        since_date = datetime.combine(
+            datetime.now().date() - timedelta(days=months_back * 30), datetime.min.time()
+        )
+
+        if not num_processes:
+            num_processes = min(len(repo_urls), os.cpu_count() or 1)
+        if os.environ.get("GIT_ANALYZER_DISABLE_CACHE") == "1":
+            use_cache = False
+        if not num_jobs:
+            num_jobs = min(len(repo_urls), CLONE_WORKERS)
+        since_ts = int(since_date.timestamp())
+
+        # Keep the results in the order of the configured repositories, so the
+        # article layout does not depend on which clone finishes first
+        all_repo_commits_structured = [None] * len(repo_urls)
+        # git filters the authors, so a worker mostly waits on its 'git log' and
+        # decodes the few matching records; starting one is the expensive part, as
+        # a spawned interpreter re-imports the main module. The pool only starts
+        # workers when a repository is submitted, which cache hits never are.
+        with ThreadPoolExecutor(max_workers=max(num_jobs, 1)) as clone_executor, \
+                ProcessPoolExecutor(max_workers=max(num_processes, 1),
+                                    mp_context=_SPAWN_CONTEXT) as analyze_executor:
+            clone_futures = {
+                clone_executor.submit(_clone_one_repo, repo_url, since_date,
+                                      deploy_target_dir): index
+                for index, repo_url in enumerate(repo_urls)
+            }
+            analyze_futures = {}
+            for clone_future in as_completed(clone_futures):
+                index = clone_futures[clone_future]
+                repo_data = clone_future.result()
+                if "error" in repo_data:
+                    all_repo_commits_structured[index] = repo_data
+                    continue
+                memo_key = (repo_data["repo_url"], repo_data["head_sha"], since_ts,
+                            tuple(company_identifiers), deploy_target_dir)
+                cache_path = None
+                if use_cache:
+                    if memo_key in _analysis_memo:
+                        _analysis_memo.move_to_end(memo_key)
+                        # Every caller gets its own copy, so mutating a result
+                        # cannot alter the memo
+                        all_repo_commits_structured[index] = {
+                            **repo_data,
+                            "commits": [dict(commit) for commit in _analysis_memo[memo_key]],
+                        }
+                        continue
+                    # Cache hits are served here: starting a worker process costs
+                    # far more than reading the cached entry
+                    cache_path = _analysis_cache_path(deploy_target_dir, repo_data["repo_url"],
+                                                      repo_data["head_sha"], since_ts,
+                                                      company_identifiers)
+                    cached_commits = _load_cached_commits(cache_path)
+                    if cached_commits is not None:
+                        _log(f"Using the cached analysis of {repo_data['repo_name']}.")
+                        all_repo_commits_structured[index] = {
+                            **repo_data, "commits": cached_commits
+                        }
+                        _remember_analysis(memo_key, cached_commits)
+                        continue
+                analyze_future = analyze_executor.submit(
+                    _analyze_one_repo, repo_data, company_identifiers, since_ts, cache_path
                 )
+                analyze_futures[analyze_future] = (index, memo_key)
 
-            except GitCommandError as e:
-                error_msg = str(e)
-                print(f"Error getting git log for {repo_name}: {error_msg}")
-                all_repo_commits_structured.append(
-                    {
-                        "repo_name": repo_name,
-                        "repo_url": repo_url,
-                        "repo_path": repo_path,
-                        "error": f"Failed to get commit log: {error_msg}",
-                        "commits": [],
-                    }
-                )
-            except Exception as e:
-                print(f"Error processing commits for {repo_name}: {e}")
-                all_repo_commits_structured.append(
-                    {
-                        "repo_name": repo_name,
-                        "repo_url": repo_url,
-                        "repo_path": repo_path,
-                        "error": f"Error processing commits: {str(e)}",
-                        "commits": [],
-                    }
-                )
+            for analyze_future, (index, memo_key) in analyze_futures.items():
+                repo_result = analyze_future.result()
+                all_repo_commits_structured[index] = repo_result
+                if use_cache and "error" not in repo_result:
+                    _remember_analysis(memo_key, repo_result["commits"])
 
         return {
             "commit_data": all_repo_commits_structured,
@@ -284,5 +781,5 @@ def analyze_real_git_commits(
         }
 
     except Exception as e:
-        print(f"An unexpected error occurred in analyze_real_git_commits: {e}")
+        _log(f"An unexpected error occurred in analyze_real_git_commits: {e}")
         return {"error": f"An unexpected error occurred: {str(e)}"}
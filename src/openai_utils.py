@@ -1,31 +1,55 @@
 """
 OpenAI Commit Message Summarizer Module
 
-This module provides a function to summarize an author's software development
-contributions based on their Git commit messages using the OpenAI API.
+This module provides functions to summarize an author's software development
+contributions based on their Git commit messages using the OpenAI API. The article
+generator uses summarize_many_commit_messages, which sends the requests of all the
+authors concurrently; summarize_commit_messages summarizes a single author with a
+blocking request, for library callers.
 
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import os
 import openai
+from src.git_utils import evict_cache_entries
 
-def summarize_commit_messages(api_key: str, commit_messages_string: str,
-                              n_months: int, author_name: str) -> str:
+# Upper bound of summary requests in flight at once, to stay within the rate limits
+MAX_CONCURRENT_SUMMARIES = 10
+
+# Summaries are cached on disk by request content, so identical requests of later
+# runs are not paid for again
+SUMMARY_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "git-analyzer", "summaries"
+)
+SUMMARY_CACHE_MAX_ENTRIES = 500
+
+# Longest commit message text sent in a single request, about 3000 tokens at the
+# usual 4 characters per token. Longer texts are summarized in chunks whose partial
+# summaries are then summarized together.
+MAX_PROMPT_CHARS = 12000
+
+SYSTEM_PROMPT = "You are a helpful assistant that summarizes software development contributions."
+
+
+def _build_prompt(commit_messages_string: str, n_months: int, author_name: str) -> str:
     """
-    Summarizes a string of commit messages using OpenAI's API.
+    Builds the prompt asking for the summary of the contributions of an author.
 
     Args:
-        api_key (str): Your OpenAI API key.
         commit_messages_string (str): A string containing all commit messages from an author.
         n_months (int): The period in months for which the commits were made.
         author_name (str): The author of commit message.
 
     Returns:
-        str: A summary of the author's contributions based on the commit messages.
+        str: The user prompt.
     """
-    openai.api_key = api_key
-
     # Craft a clear and concise prompt for OpenAI
-    prompt = (
+    return (
         f"Summarize the following software development contributions from an author which name is {author_name}"
         f"over a period of {n_months} months based on his or her commit messages.\n"
         f"- Don\'t change the author name that muse be {author_name}\n"
@@ -35,19 +59,340 @@ def summarize_commit_messages(api_key: str, commit_messages_string: str,
         f"Commit Messages:\n---\n{commit_messages_string}\n---"
     )
 
+
+def _build_combine_prompt(partial_summaries: str, n_months: int, author_name: str) -> str:
+    """
+    Builds the prompt asking to combine the partial summaries of the contributions of
+    an author, made over chunks of a commit history too long for a single request.
+
+    Args:
+        partial_summaries (str): The partial summaries, one per line.
+        n_months (int): The period in months for which the commits were made.
+        author_name (str): The author of commit message.
+
+    Returns:
+        str: The user prompt.
+    """
+    return (
+        "Combine the following partial summaries of the software development contributions "
+        f"from an author which name is {author_name} over a period of {n_months} months "
+        "into a single summary. Each partial summary covers a different part of the "
+        "commit history.\n"
+        f"- Don't change the author name that must be {author_name}\n"
+        '- Focus on key features, bug fixes, improvements, and overall progress.\n'
+        '- Merge the contributions mentioned by several partial summaries.\n'
+        '- Provide a concise yet comprehensive overview in a few sentences.\n\n'
+        f"Partial Summaries:\n---\n{partial_summaries}\n---"
+    )
+
+
+def _completion_options(prompt: str) -> dict:
+    """
+    Returns the options of the chat completion request summarizing a prompt.
+
+    Args:
+        prompt (str): The user prompt.
+
+    Returns:
+        dict: The keyword arguments of chat.completions.create.
+    """
+    return {
+        "model": "gpt-3.5-turbo",  # Or "gpt-4" for potentially better results
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "max_tokens": 300,  # Adjust as needed for desired summary length
+        "temperature": 0.7  # Controls randomness. Lower values for more focused summaries.
+    }
+
+
+def _split_messages(commit_messages_string: str, max_chars: int) -> list[str]:
+    """
+    Splits commit messages into chunks of at most max_chars characters, cutting
+    between lines. A single line longer than max_chars is cut into pieces.
+
+    Args:
+        commit_messages_string (str): The commit messages, one per line.
+        max_chars (int): The maximum length of a chunk.
+
+    Returns:
+        list[str]: The chunks, in their original order.
+    """
+    chunks = []
+    chunk_lines = []
+    chunk_size = 0
+    for line in commit_messages_string.split("\n"):
+        for start in range(0, max(len(line), 1), max_chars):
+            piece = line[start:start + max_chars]
+            # Adding the piece and its newline would overflow the current chunk
+            if chunk_lines and chunk_size + len(piece) + 1 > max_chars:
+                chunks.append("\n".join(chunk_lines))
+                chunk_lines = []
+                chunk_size = 0
+            chunk_lines.append(piece)
+            chunk_size += len(piece) + 1
+    chunks.append("\n".join(chunk_lines))
+    return chunks
+
+
+async def _request_summary(client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                           prompt: str) -> str:
+    """
+    Sends a single summary request, or returns its cached answer.
+
+    Args:
+        client (openai.AsyncOpenAI): The client shared by the concurrent requests.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        prompt (str): The user prompt.
+
+    Returns:
+        str: The summary.
+
+    Raises:
+        openai.APIError: If the request fails.
+    """
+    options = _completion_options(prompt)
+    cache_path = _summary_cache_path(options)
+    summary = _load_cached_summary(cache_path)
+    if summary is not None:
+        return summary
+
+    async with semaphore:
+        response = await client.chat.completions.create(**options)
+    summary = response.choices[0].message.content.strip()
+    _store_cached_summary(cache_path, summary)
+    return summary
+
+
+async def _combine_summaries(client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                             partial_summaries: list[str], n_months: int,
+                             author_name: str) -> str:
+    """
+    Combines partial summaries of the contributions of an author into one. When they
+    do not fit a single request, they are combined by groups first.
+
+    Args:
+        client (openai.AsyncOpenAI): The client shared by the concurrent requests.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        partial_summaries (list[str]): The summaries of consecutive chunks of the
+                                       commit messages.
+        n_months (int): The period in months for which the commits were made.
+        author_name (str): The author of commit message.
+
+    Returns:
+        str: The combined summary.
+
+    Raises:
+        openai.APIError: If a request fails.
+    """
+    groups = _split_messages("\n".join(partial_summaries), MAX_PROMPT_CHARS)
+    combined_summaries = await asyncio.gather(*(
+        _request_summary(client, semaphore,
+                         _build_combine_prompt(group, n_months, author_name))
+        for group in groups
+    ))
+    if len(combined_summaries) == 1:
+        return combined_summaries[0]
+    return await _combine_summaries(client, semaphore, combined_summaries,
+                                    n_months, author_name)
+
+
+async def _summarize_async(client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                           commit_messages_string: str, n_months: int,
+                           author_name: str) -> str:
+    """
+    Summarizes commit messages, splitting them into chunks that fit a single request
+    when they are too long: the chunks are summarized concurrently, then their
+    summaries are combined. Every request is cached on its own, so a change in one
+    chunk only requests that chunk and the combined summary again.
+
+    Args:
+        client (openai.AsyncOpenAI): The client shared by the concurrent requests.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        commit_messages_string (str): A string containing all commit messages from an author.
+        n_months (int): The period in months for which the commits were made.
+        author_name (str): The author of commit message.
+
+    Returns:
+        str: A summary of the author's contributions based on the commit messages.
+
+    Raises:
+        openai.APIError: If a request fails.
+    """
+    chunks = _split_messages(commit_messages_string, MAX_PROMPT_CHARS)
+    partial_summaries = await asyncio.gather(*(
+        _request_summary(client, semaphore, _build_prompt(chunk, n_months, author_name))
+        for chunk in chunks
+    ))
+    if len(partial_summaries) == 1:
+        return partial_summaries[0]
+    return await _combine_summaries(client, semaphore, partial_summaries,
+                                    n_months, author_name)
+
+
+def _summary_cache_path(options: dict) -> str | None:
+    """
+    Builds the path of the cached summary of a request. The key covers the whole
+    request, model and prompt included, so any change to it makes a new entry.
+
+    Args:
+        options (dict): The keyword arguments of chat.completions.create.
+
+    Returns:
+        str: The path of the JSON cache entry, or None if the cache is disabled by
+             setting GIT_ANALYZER_DISABLE_CACHE=1 in the environment.
+    """
+    if os.environ.get("GIT_ANALYZER_DISABLE_CACHE") == "1":
+        return None
+    key = hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()
+    return os.path.join(SUMMARY_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_summary(cache_path: str | None) -> str | None:
+    """
+    Loads a cached summary and marks it as recently used.
+
+    Args:
+        cache_path (str): The path of the JSON cache entry, or None.
+
+    Returns:
+        str: The cached summary, or None on a cache miss.
+    """
+    if cache_path is None:
+        return None
     try:
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",  # Or "gpt-4" for potentially better results
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that summarizes software development contributions."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=300,  # Adjust as needed for desired summary length
-            temperature=0.7  # Controls randomness. Lower values for more focused summaries.
-        )
-        return response.choices[0].message.content.strip()
+        with open(cache_path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+        os.utime(cache_path)
+        return summary
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_summary(cache_path: str | None, summary: str):
+    """
+    Stores a summary in the cache and evicts the least recently used entries beyond
+    SUMMARY_CACHE_MAX_ENTRIES. Failures only cost a future cache miss.
+
+    Args:
+        cache_path (str): The path of the JSON cache entry, or None.
+        summary (str): The summary returned by the API.
+    """
+    if cache_path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write then rename, so concurrent runs never read a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        os.replace(tmp_path, cache_path)
+        evict_cache_entries(os.path.dirname(cache_path), SUMMARY_CACHE_MAX_ENTRIES)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def _client(api_key: str) -> openai.OpenAI:
+    """
+    Returns the client of an API key, created once so that its connection pool is
+    reused by the following requests.
+
+    Args:
+        api_key (str): Your OpenAI API key.
+
+    Returns:
+        openai.OpenAI: The client.
+    """
+    return openai.OpenAI(api_key=api_key)
+
+
+def summarize_commit_messages(api_key: str, commit_messages_string: str,
+                              n_months: int, author_name: str) -> str:
+    """
+    Summarizes a string of commit messages using OpenAI's API, with a single blocking
+    request. The article generator does not use it: it summarizes all the authors
+    at once with summarize_many_commit_messages.
+
+    Args:
+        api_key (str): Your OpenAI API key.
+        commit_messages_string (str): A string containing all commit messages from an author.
+        n_months (int): The period in months for which the commits were made.
+        author_name (str): The author of commit message.
+
+    Returns:
+        str: A summary of the author's contributions based on the commit messages.
+    """
+    options = _completion_options(_build_prompt(commit_messages_string, n_months, author_name))
+    cache_path = _summary_cache_path(options)
+    summary = _load_cached_summary(cache_path)
+    if summary is not None:
+        return summary
+
+    try:
+        response = _client(api_key).chat.completions.create(**options)
+        summary = response.choices[0].message.content.strip()
+        _store_cached_summary(cache_path, summary)
+        return summary
+    except openai.APIError as e:
+        return f"An OpenAI API error occurred: {e}"
+    except Exception as e:
+        return f"An unexpected error occurred: {e}"
+
+
+async def summarize_commit_messages_async(client: openai.AsyncOpenAI,
+                                          semaphore: asyncio.Semaphore,
+                                          commit_messages_string: str,
+                                          n_months: int, author_name: str) -> str:
+    """
+    Summarizes a string of commit messages using OpenAI's API, without blocking the
+    other summaries running on the same event loop. Messages too long for a single
+    request are summarized in chunks, then the partial summaries are summarized.
+
+    Args:
+        client (openai.AsyncOpenAI): The client shared by the concurrent requests.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        commit_messages_string (str): A string containing all commit messages from an author.
+        n_months (int): The period in months for which the commits were made.
+        author_name (str): The author of commit message.
+
+    Returns:
+        str: A summary of the author's contributions based on the commit messages.
+    """
+    try:
+        return await _summarize_async(client, semaphore, commit_messages_string,
+                                      n_months, author_name)
     except openai.APIError as e:
         return f"An OpenAI API error occurred: {e}"
     except Exception as e:
         return f"An unexpected error occurred: {e}"
 
+
+def summarize_many_commit_messages(api_key: str, requests: list[tuple[str, str]],
+                                   n_months: int) -> list[str]:
+    """
+    Summarizes the commit messages of several authors with concurrent requests, so
+    the total wait is about the slowest request rather than the sum of all of them.
+
+    Args:
+        api_key (str): Your OpenAI API key.
+        requests (list[tuple[str, str]]): The (commit_messages_string, author_name)
+                                          pairs to summarize.
+        n_months (int): The period in months for which the commits were made.
+
+    Returns:
+        list[str]: The summaries, in the order of the requests.
+    """
+    async def _summarize_all():
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+        async with openai.AsyncOpenAI(api_key=api_key) as client:
+            return await asyncio.gather(*(
+                summarize_commit_messages_async(client, semaphore, messages,
+                                                n_months, author_name)
+                for messages, author_name in requests
+            ))
+
+    if not requests:
+        return []
+    return asyncio.run(_summarize_all())